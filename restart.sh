@@ -11,6 +11,9 @@ done
 # Pull latest code (if using git)
 git pull
 
+# Precompile bytecode so startup loads cached .pyc files instead of compiling sources
+python3 -m compileall -q src
+
 # Start new session using system Python (cleaner, has rgbmatrix library)
 tmux new-session -d -s myscript "sudo python3 src/main.py"
 
@@ -4,27 +4,23 @@ Flight Announcer Configuration
 Configuration for the LGA flight monitoring LED matrix display.
 """
 
+import os
+
 try:
     from env_loader import get_env_var, get_bool_env, get_cached_env
 except ImportError:
+    _TRUTHY_VALUES = frozenset(('true', '1', 'yes', 'on'))
+
     def get_env_var(key, default=None, env_vars=None):
-        import os
         return os.environ.get(key, default)
-    
+
     def get_bool_env(key, default=False, env_vars=None):
-        import os
         value = os.environ.get(key, str(default).lower())
-        return value.lower() in ('true', '1', 'yes', 'on')
+        return value in _TRUTHY_VALUES or value.lower() in _TRUTHY_VALUES
     
     def get_cached_env():
         return {}
 
-# Load environment variables once
-try:
-    _env_vars = get_cached_env()
-except:
-    _env_vars = {}
-
 # LED Matrix Configuration (from working test_matrix.py)
 MATRIX_ROWS = 32
 MATRIX_COLS = 64
@@ -59,11 +55,12 @@ TEXT_SPEED = 0.08                  # Speed of text scrolling
 FLIGHT_SEARCH_TAIL = "&faa=1&satellite=1&mlat=1&flarm=1&adsb=1&gnd=0&air=1&vehicles=0&estimated=0&maxage=14400&gliders=0&stats=0&ems=1&limit=1"
 
 # Request Headers (for FlightRadar24 API)
-REQUEST_HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:106.0) Gecko/20100101 Firefox/106.0",
-    "cache-control": "no-store, no-cache, must-revalidate, post-check=0, pre-check=0",
-    "accept": "application/json"
-}
+# Stored as constant pairs; the REQUEST_HEADERS dict is only built on first access
+_REQUEST_HEADER_ITEMS = (
+    ("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:106.0) Gecko/20100101 Firefox/106.0"),
+    ("cache-control", "no-store, no-cache, must-revalidate, post-check=0, pre-check=0"),
+    ("accept", "application/json"),
+)
 
 # Display Layout
 DISPLAY_WIDTH = MATRIX_COLS * MATRIX_CHAIN_LENGTH  # 128 pixels wide
@@ -73,11 +70,26 @@ DISPLAY_HEIGHT = MATRIX_ROWS  # 32 pixels tall
 MAX_CONNECTION_RETRIES = 3
 CONNECTION_TIMEOUT = 10  # seconds
 
-# Stats Tracking Configuration
-STATS_ENABLED = get_bool_env("STATS_ENABLED", True, _env_vars)
-# Use /tmp for database to avoid permission issues with sudo
-STATS_DB_PATH = get_env_var("STATS_DB_PATH", "/tmp/flight_stats.db", _env_vars)
+# Derived settings are resolved lazily on first access (PEP 562), so importing
+# config for constants alone never builds headers or touches the environment/.env file
+_LAZY_SETTINGS = {
+    "REQUEST_HEADERS": lambda env: dict(_REQUEST_HEADER_ITEMS),
+    
+    # Stats Tracking Configuration
+    "STATS_ENABLED": lambda env: get_bool_env("STATS_ENABLED", True, env),
+    # Use /tmp for database to avoid permission issues with sudo
+    "STATS_DB_PATH": lambda env: get_env_var("STATS_DB_PATH", "/tmp/flight_stats.db", env),
+    
+    # Debug Settings (can be overridden by environment variables)
+    "DEBUG_MODE": lambda env: get_bool_env("DEBUG_MODE", False, env),
+    "PRINT_MEMORY_INFO": lambda env: get_bool_env("PRINT_MEMORY_INFO", False, env),
+}
 
-# Debug Settings (can be overridden by environment variables)
-DEBUG_MODE = get_bool_env("DEBUG_MODE", False, _env_vars)
-PRINT_MEMORY_INFO = get_bool_env("PRINT_MEMORY_INFO", False, _env_vars)
\ No newline at end of file
+def __getattr__(name):
+    """Compute a derived setting on first access and cache it as a module global."""
+    factory = _LAZY_SETTINGS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = factory(get_cached_env())
+    globals()[name] = value
+    return value
\ No newline at end of file
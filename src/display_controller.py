@@ -9,6 +9,7 @@ import time
 import sys
 import os
 import re
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 # Add the library path
@@ -21,6 +22,12 @@ except ImportError:
     HARDWARE_AVAILABLE = False
     print("Warning: rgbmatrix library not available - running in test mode")
 
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
 try:
     import config
     from flight_logic import CANADIAN_AIRPORTS, is_canadian_private_jet
@@ -28,11 +35,328 @@ except ImportError:
     print("Error: Could not import config module")
     exit(1)
 
+# Resolved once at import so frame paths test a plain module global
+_DEBUG = config.DEBUG_MODE
+
+# Improved 5x8 font patterns for better readability
+# (each row is a bitmask, most significant bit = leftmost column)
+_FONT_PATTERNS = {
+    '0': [0b11111, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b11111],
+    '1': [0b00100, 0b01100, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b11111],
+    '2': [0b11111, 0b00001, 0b00001, 0b11111, 0b10000, 0b10000, 0b10000, 0b11111],
+    '3': [0b11111, 0b00001, 0b00001, 0b11111, 0b00001, 0b00001, 0b00001, 0b11111],
+    '4': [0b10001, 0b10001, 0b10001, 0b11111, 0b00001, 0b00001, 0b00001, 0b00001],
+    '5': [0b11111, 0b10000, 0b10000, 0b11111, 0b00001, 0b00001, 0b00001, 0b11111],
+    '6': [0b11111, 0b10000, 0b10000, 0b11111, 0b10001, 0b10001, 0b10001, 0b11111],
+    '7': [0b11111, 0b00001, 0b00001, 0b00010, 0b00100, 0b01000, 0b01000, 0b01000],
+    '8': [0b11111, 0b10001, 0b10001, 0b11111, 0b10001, 0b10001, 0b10001, 0b11111],
+    '9': [0b11111, 0b10001, 0b10001, 0b11111, 0b00001, 0b00001, 0b00001, 0b11111],
+    'A': [0b11111, 0b10001, 0b10001, 0b11111, 0b10001, 0b10001, 0b10001, 0b10001],
+    'B': [0b11110, 0b10001, 0b10001, 0b11110, 0b10001, 0b10001, 0b10001, 0b11110],
+    'C': [0b11111, 0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b11111],
+    'D': [0b11110, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b11110],
+    'E': [0b11111, 0b10000, 0b10000, 0b11111, 0b10000, 0b10000, 0b10000, 0b11111],
+    'F': [0b11111, 0b10000, 0b10000, 0b11111, 0b10000, 0b10000, 0b10000, 0b10000],
+    'G': [0b11111, 0b10000, 0b10000, 0b10111, 0b10001, 0b10001, 0b10001, 0b11111],
+    'H': [0b10001, 0b10001, 0b10001, 0b11111, 0b10001, 0b10001, 0b10001, 0b10001],
+    'I': [0b11111, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b11111],
+    'J': [0b11111, 0b00001, 0b00001, 0b00001, 0b00001, 0b10001, 0b10001, 0b11111],
+    'K': [0b10001, 0b10010, 0b10100, 0b11000, 0b10100, 0b10010, 0b10001, 0b10001],
+    'L': [0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b11111],
+    'M': [0b10001, 0b11011, 0b10101, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001],
+    'N': [0b10001, 0b11001, 0b10101, 0b10101, 0b10011, 0b10001, 0b10001, 0b10001],
+    'O': [0b11111, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b11111],
+    'P': [0b11111, 0b10001, 0b10001, 0b11111, 0b10000, 0b10000, 0b10000, 0b10000],
+    'Q': [0b11111, 0b10001, 0b10001, 0b10001, 0b10101, 0b10011, 0b10001, 0b11111],
+    'R': [0b11111, 0b10001, 0b10001, 0b11111, 0b10100, 0b10010, 0b10001, 0b10001],
+    'S': [0b11111, 0b10000, 0b10000, 0b11111, 0b00001, 0b00001, 0b00001, 0b11111],
+    'T': [0b11111, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100],
+    'U': [0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b11111],
+    'V': [0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b01010, 0b01010, 0b00100],
+    'W': [0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b10101, 0b11011, 0b10001],
+    'X': [0b10001, 0b10001, 0b01010, 0b00100, 0b01010, 0b10001, 0b10001, 0b10001],
+    'Y': [0b10001, 0b10001, 0b01010, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100],
+    'Z': [0b11111, 0b00001, 0b00010, 0b00100, 0b01000, 0b10000, 0b10000, 0b11111],
+    ' ': [0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000],
+    ':': [0b00000, 0b00100, 0b00100, 0b00000, 0b00000, 0b00100, 0b00100, 0b00000],
+    '-': [0b00000, 0b00000, 0b00000, 0b11111, 0b00000, 0b00000, 0b00000, 0b00000],
+    '→': [0b00000, 0b00100, 0b00010, 0b11111, 0b00010, 0b00100, 0b00000, 0b00000],
+    '.': [0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00100, 0b00100],
+    '@': [0b11111, 0b10001, 0b10101, 0b10111, 0b10110, 0b10000, 0b10000, 0b11111],
+    '/': [0b00001, 0b00001, 0b00010, 0b00100, 0b01000, 0b10000, 0b10000, 0b10000],
+    '°': [0b01110, 0b10001, 0b10001, 0b01110, 0b00000, 0b00000, 0b00000, 0b00000],
+    '!': [0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b00000, 0b00000, 0b00100],
+    "'": [0b00100, 0b00100, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000],
+    '%': [0b00000000, 0b00000000, 0b01100100, 0b01101000, 0b00010000, 0b00100000, 0b01001100, 0b10001100],
+}
+
+def _build_glyph(pattern: list, width: int) -> tuple:
+    """Convert a row-bitmask pattern into (col, row, length) runs of lit pixels."""
+    runs = []
+    for row, bits in enumerate(pattern):
+        col = 0
+        while col < width:
+            if bits & (1 << (width - 1 - col)):
+                start = col
+                while col < width and bits & (1 << (width - 1 - col)):
+                    col += 1
+                runs.append((start, row, col - start))
+            else:
+                col += 1
+    return tuple(runs)
+
+def _glyph_spans(runs: tuple) -> tuple:
+    """Turn (col, row, length) runs into (byte offset from the glyph origin, length) spans."""
+    return tuple(((row * config.DISPLAY_WIDTH + col) * 3, length) for col, row, length in runs)
+
+# Glyph atlas built once at import: char -> (lit pixel runs, horizontal advance, framebuffer spans)
+# % is 8 pixels wide, every other character is 5 pixels; both get 1 pixel of spacing
+_GLYPHS = {}
+for _char, _pattern in _FONT_PATTERNS.items():
+    _runs = _build_glyph(_pattern, 8) if _char == '%' else _build_glyph(_pattern, 5)
+    _GLYPHS[_char] = (_runs, 9 if _char == '%' else 6, _glyph_spans(_runs))
+del _char, _pattern, _runs
+_UNKNOWN_GLYPH = ((), 6, ())  # Unknown characters are skipped but keep their spacing
+_FONT_HEIGHT = 8
+
+@lru_cache(maxsize=64)
+def _text_layout(text: str) -> tuple:
+    """
+    Lay out a whole string once, since the same lines are redrawn frame after frame.
+    
+    Returns (width, runs, spans): the glyph runs and framebuffer spans of every
+    character combined, relative to the origin of the string.
+    """
+    runs = []
+    spans = []
+    char_x = 0
+    for char in text.upper():
+        glyph_runs, advance, glyph_spans = _GLYPHS.get(char, _UNKNOWN_GLYPH)
+        runs.extend((char_x + col, row, length) for col, row, length in glyph_runs)
+        spans.extend((char_x * 3 + offset, length) for offset, length in glyph_spans)
+        char_x += advance
+    return char_x, tuple(runs), tuple(spans)
+
+# METAR patterns, compiled once
+_TEMP_RE = re.compile(r'(\d+)/(\d+)')  # Temperature/dewpoint like "29/22"
+_WIND_RE = re.compile(r'(\d{3})(\d{2,3})(?:G(\d{2,3}))?KT')  # Wind like "18006KT" or "25009G19KT"
+# Any precipitation (rain, snow, storms); SHRA, TSRA, SHSN, BLSN and VCTS all contain one of these
+_PRECIP_RE = re.compile(r'RA|DZ|SN|TS', re.IGNORECASE)
+_CLEAR_RE = re.compile(r'CLR|SKC', re.IGNORECASE)  # Clear sky reported by automated or human observers
+
+def _metar_temperature(metar: str) -> str:
+    """Extract temperature information from METAR string."""
+    if not metar:
+        return None
+
+    # Look for temperature/dewpoint pattern like "29/22"
+    temp_match = _TEMP_RE.search(metar)
+    if temp_match:
+        temp = temp_match.group(1)
+        return f"{temp}°C"
+    return None
+
+def _metar_wind(metar: str) -> str:
+    """Extract wind information from METAR string."""
+    if not metar:
+        return None
+
+    # Look for wind pattern like "18006KT" or "25009G19KT" (with optional gusts)
+    wind_match = _WIND_RE.search(metar)
+    if not wind_match:
+        return None
+    
+    direction = wind_match.group(1)
+    speed = wind_match.group(2).lstrip('0') or '0'
+    gust = wind_match.group(3)
+
+    if gust:
+        gust = gust.lstrip('0') or '0'
+        return f"{direction}@{speed}G{gust}kt"
+    return f"{direction}@{speed}kt"
+
+def _metar_condition(metar: str) -> str:
+    """Parse weather condition from METAR string - simplified to 3 categories."""
+    if not metar:
+        return "cloudy"
+
+    # Check for any precipitation (rain, snow, storms)
+    # (both patterns ignore case, so the METAR is searched as is)
+    if _PRECIP_RE.search(metar):
+        return "rainy"
+
+    # Check for clear/sunny conditions
+    elif _CLEAR_RE.search(metar):
+        return "sunny"
+
+    # Everything else defaults to cloudy (overcast/cloudy conditions)
+    return "cloudy"
+
+@lru_cache(maxsize=4)
+def _parse_metar(metar: str) -> tuple:
+    """Parse a METAR once into (condition, temperature, wind); reports change about hourly."""
+    return _metar_condition(metar), _metar_temperature(metar), _metar_wind(metar)
+
+# 10x10 plane pattern designed by user (used by the animation and the static icon)
+_PLANE_PATTERN = (
+    "          ",
+    "      PP  ",
+    "    PPP   ",
+    "  PPP   PP",
+    "PPPPPPPPPP",
+    "PPPPPPPPPP",
+    "  PPP   PP",
+    "    PPP   ",
+    "      PP  ",
+    "          "
+)
+
+# 18x18 pixel weather icons
+_WEATHER_ICONS = {
+    "sunny": [
+        "                  ",  # Row 0 - Empty
+        " s      s      s  ",  # Row 1 - Top ray
+        "  s     s     s   ",  # Row 2 - Diagonal rays
+        "   s    s    s    ",  # Row 3 - Diagonal rays
+        "                  ",  # Row 4 - Empty
+        "     sssssss      ",  # Row 5 - Top of circle
+        "    sssssssss     ",  # Row 6 - Circle sides
+        "    sssssssss     ",  # Row 7 - Circle
+        "    sssssssss     ",  # Row 8 - Circle
+        "sss sssssssss  sss",  # Row 9 - Circle + left/right rays
+        "    sssssssss     ",  # Row 10 - Circle
+        "    sssssssss     ",  # Row 11 - Circle
+        "    sssssssss     ",  # Row 12 - Circle sides
+        "     sssssss      ",  # Row 13 - Bottom of circle
+        "                  ",  # Row 17 - Empty
+        "    s   s   s     ",  # Row 14 - Diagonal rays
+        "   s    s    s    ",  # Row 15 - Diagonal rays
+        "  s     s     s   ",  # Row 16 - Diagonal rays
+    ],
+    "cloudy": [
+        "                  ",
+        "                  ",
+        "  ~~~~~~~~~~~~~~  ",
+        "                  ",
+        "                  ",
+        "~~~~~~~~~~~~      ",
+        "                  ",
+        "                  ",
+        "      ~~~~~~~~~~  ",
+        "                  ",
+        "                  ",
+        "  ~~~~~~~~~~~~~~  ",
+        "                  ",
+        "                  ",
+        "~~~~~~~~~~        ",
+        "                  ",
+        "                  ",
+        "                  "
+    ],
+    "rainy": [
+        "                  ",  # Row 0 - Empty
+        "                  ",  # Row 1 - Empty
+        "                  ",  # Row 1 - Empty
+        "        o         ",  # Row 2 - Single point at top
+        "       ooo        ",  # Row 3 - Start widening
+        "      ooooo       ",  # Row 4 - Wider
+        "     ooooooo      ",  # Row 5 - Wider
+        "    ooooooooo     ",  # Row 6 - Wider
+        "   ooooooooooo    ",  # Row 7 - Wider
+        "  ooooooooooooo   ",  # Row 8 - Wider
+        "  ooooooooooooo   ",  # Row 9 - Widest part (13 pixels)
+        "  ooooooooooooo   ",  # Row 10 - Widest part (13 pixels)
+        "   ooooooooooo    ",  # Row 11 - Widest part (13 pixels)
+        "    ooooooooo     ",  # Row 12 - Start rounding (11 pixels)
+        "     ooooooo      ",  # Row 13 - More rounded (9 pixels)
+        "                  ",  # Row 15 - Rounded bottom (5 pixels)
+        "                  ",  # Row 16 - Rounded bottom (3 pixels)
+        "                  ",  # Row 17 - Empty
+    ]
+}
+
+# Color mapping for weather elements (spaces are transparent)
+_WEATHER_ICON_COLORS = {
+    's': (255, 200, 0),     # Yellow/orange (sun)
+    'o': (0, 100, 255),     # Blue (rain drop)
+    '~': (255, 255, 255),   # White (cloud lines)
+}
+
+def _pattern_runs(pattern, char: str) -> tuple:
+    """Find (col, row, length) runs of a character in a list of pattern strings."""
+    return tuple((match.start(), row, match.end() - match.start())
+                 for row, line in enumerate(pattern)
+                 for match in re.finditer(re.escape(char) + '+', line))
+
+# 13x8 pixel Canada flag pattern
+# R = Red, W = White, . = transparent
+_CANADA_FLAG_PATTERN = (
+    "RRR.......RRR",  # Row 0
+    "RRR...R...RRR",  # Row 1 - start of maple leaf
+    "RRR.R.R.R.RRR",  # Row 2 - maple leaf
+    "RRR.RRRRR.RRR",  # Row 3 - maple leaf center
+    "RRR..RRR..RRR",  # Row 4 - maple leaf
+    "RRR.R.R.R.RRR",  # Row 5 - maple leaf stem
+    "RRR...R...RRR",  # Row 6 - maple leaf stem
+    "RRR.......RRR",  # Row 7
+)
+
+# Color mapping for the flag
+_CANADA_FLAG_COLORS = {
+    'R': (255, 0, 0),      # Red
+    'W': (255, 255, 255),  # White
+}
+
+def _compile_sprite(pattern, colors: dict) -> tuple:
+    """
+    Compile a pattern into a sprite for _blit_sprite.
+    
+    Returns (width, height, runs, spans) where runs are (col, row, length, pixel bytes)
+    for each horizontal stretch of one color; characters not in colors are transparent.
+    spans hold the same runs as (byte offset from the sprite origin, fill bytes) for
+    drawing a sprite that is entirely on screen.
+    """
+    runs = tuple((col, row, length, bytes(color))
+                 for char, color in colors.items()
+                 for col, row, length in _pattern_runs(pattern, char))
+    spans = tuple(((row * config.DISPLAY_WIDTH + col) * 3, pixel * length)
+                  for col, row, length, pixel in runs)
+    return len(pattern[0]), len(pattern), runs, spans
+
+@lru_cache(maxsize=4)
+def _plane_sprite(color: tuple) -> tuple:
+    """Plane sprite in the given color (the animation and static icon share the pattern)."""
+    return _compile_sprite(_PLANE_PATTERN, {'P': color})
+
+# Sprites compiled once at import so drawing never scans the blank cells
+_WEATHER_ICON_SPRITES = {
+    condition: _compile_sprite(icon, _WEATHER_ICON_COLORS)
+    for condition, icon in _WEATHER_ICONS.items()
+}
+_CANADA_FLAG_SPRITE = _compile_sprite(_CANADA_FLAG_PATTERN, _CANADA_FLAG_COLORS)
+
+@lru_cache(maxsize=64)
+def _centered_layout(text_len: int, has_flag: bool) -> tuple:
+    """Return (flag_x, text_x) that center a line of text, optionally led by a Canada flag."""
+    text_width = text_len * 6  # 6 pixels per character
+    if not has_flag:
+        return None, (config.DISPLAY_WIDTH - text_width) // 2
+    
+    flag_width = 13  # Canada flag is 13 pixels wide
+    flag_spacing = 2  # Space between flag and text
+    total_width = flag_width + flag_spacing + text_width
+    
+    # Center the entire combination
+    start_x = (config.DISPLAY_WIDTH - total_width) // 2
+    return start_x, start_x + flag_width + flag_spacing
+
 class DisplayController:
     """Handles LED matrix display operations with double buffering and selective updating."""
     
     def __init__(self):
         self.matrix = None
+        self.offscreen_canvas = None  # rgbmatrix frame canvas for frame pushes (needs PIL)
+        self._canvas_stale_bbox = None  # [x0, y0, x1, y1) where the offscreen canvas may differ from the panel, None when in sync
         self.hardware_ready = False
         
         # Double buffering system
@@ -40,11 +364,15 @@ class DisplayController:
         self.back_buffer = None
         
         # Selective update tracking
-        self.dirty_pixels = set()  # Set of (x, y) coordinates that need updating
-        self.dirty_regions = []    # List of (x, y, width, height) regions that need updating
+        self._dirty_bbox = None    # [x0, y0, x1, y1) bounding every pixel drawn since the last swap, None when clean
+        self._forced_bbox = None   # [x0, y0, x1, y1) to re-send on the next swap even if unchanged, None when not requested
         
-        # For debugging: keep track of what's being displayed
-        self.debug_display = []
+        # Pre-rendered frame for the static "no flights" screen (built on first use)
+        self._no_flights_frame = None
+        
+        # Inputs of the screen currently shown by a show_* method; a repeat call
+        # with the same inputs leaves the panel as it is (any other swap clears it)
+        self._frame_key = None
         
         if HARDWARE_AVAILABLE:
             self._init_hardware()
@@ -64,9 +392,11 @@ class DisplayController:
             options.hardware_mapping = config.MATRIX_HARDWARE_MAPPING
             
             self.matrix = RGBMatrix(options=options)
+            if PIL_AVAILABLE:
+                self.offscreen_canvas = self.matrix.CreateFrameCanvas()
             self.hardware_ready = True
             
-            if config.DEBUG_MODE:
+            if _DEBUG:
                 print(f"LED Matrix initialized: {self.matrix.width}x{self.matrix.height}")
             
         except Exception as e:
@@ -78,15 +408,15 @@ class DisplayController:
         width = config.DISPLAY_WIDTH
         height = config.DISPLAY_HEIGHT
         
-        # Initialize front and back buffers as 2D arrays of RGB tuples
-        self.front_buffer = [[(0, 0, 0) for _ in range(width)] for _ in range(height)]
-        self.back_buffer = [[(0, 0, 0) for _ in range(width)] for _ in range(height)]
+        # Initialize front and back buffers as contiguous row-major RGB bytes
+        # (pixel (x, y) lives at offset (y * width + x) * 3)
+        self.front_buffer = bytearray(width * height * 3)
+        self.back_buffer = bytearray(width * height * 3)
         
         # Clear dirty tracking
-        self.dirty_pixels.clear()
-        self.dirty_regions.clear()
+        self._reset_dirty()
         
-        if config.DEBUG_MODE:
+        if _DEBUG:
             print(f"Double buffers initialized: {width}x{height}")
     
     def _set_pixel_buffer(self, x: int, y: int, color: tuple, buffer=None):
@@ -94,74 +424,196 @@ class DisplayController:
         if buffer is None:
             buffer = self.back_buffer
         
-        if 0 <= x < config.DISPLAY_WIDTH and 0 <= y < config.DISPLAY_HEIGHT:
-            buffer[y][x] = color
+        width = config.DISPLAY_WIDTH
+        height = config.DISPLAY_HEIGHT
+        if 0 <= x < width and 0 <= y < height:
+            offset = (y * width + x) * 3
+            buffer[offset] = color[0]
+            buffer[offset + 1] = color[1]
+            buffer[offset + 2] = color[2]
             # Mark pixel as dirty for selective updating
-            self.dirty_pixels.add((x, y))
+            self._extend_dirty_bbox(x, y, x + 1, y + 1)
     
     def _clear_buffer(self, buffer=None):
         """Clear the specified buffer (defaults to back buffer)."""
         if buffer is None:
             buffer = self.back_buffer
         
-        width = config.DISPLAY_WIDTH
-        height = config.DISPLAY_HEIGHT
-        
-        for y in range(height):
-            for x in range(width):
-                buffer[y][x] = (0, 0, 0)
-                self.dirty_pixels.add((x, y))
+        # Single C-level memset instead of a per-pixel Python loop
+        buffer[:] = bytes(len(buffer))
+        self._mark_all_dirty()
+    
+    def _mark_all_dirty(self):
+        """Mark the whole display dirty until the next swap."""
+        self._dirty_bbox = [0, 0, config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT]
+    
+    def _reset_dirty(self):
+        """Clear dirty tracking after a frame has been pushed."""
+        self._dirty_bbox = None
+        self._forced_bbox = None
+    
+    def _extend_dirty_bbox(self, x0: int, y0: int, x1: int, y1: int):
+        """Grow the dirty bounding box to cover [x0, x1) x [y0, y1) (already clipped)."""
+        bbox = self._dirty_bbox
+        if bbox is None:
+            self._dirty_bbox = [x0, y0, x1, y1]
+            return
+        if x0 < bbox[0]:
+            bbox[0] = x0
+        if y0 < bbox[1]:
+            bbox[1] = y0
+        if x1 > bbox[2]:
+            bbox[2] = x1
+        if y1 > bbox[3]:
+            bbox[3] = y1
     
     def _add_dirty_region(self, x: int, y: int, width: int, height: int):
         """Add a rectangular region to be updated."""
-        self.dirty_regions.append((x, y, width, height))
-        
-        # Also add individual pixels to dirty set for fine-grained control
-        for dy in range(height):
-            for dx in range(width):
-                px, py = x + dx, y + dy
-                if 0 <= px < config.DISPLAY_WIDTH and 0 <= py < config.DISPLAY_HEIGHT:
-                    self.dirty_pixels.add((px, py))
+        # Clip to the display, then grow the dirty bounding box to cover it
+        x0, x1 = max(x, 0), min(x + width, config.DISPLAY_WIDTH)
+        y0, y1 = max(y, 0), min(y + height, config.DISPLAY_HEIGHT)
+        if x0 < x1 and y0 < y1:
+            self._extend_dirty_bbox(x0, y0, x1, y1)
+    
+    def _carry_dirty_forward(self):
+        """Copy the dirty bounding box from the (just swapped) front buffer into the back buffer."""
+        # The back buffer now holds the previous frame, which differs from the
+        # new front buffer only inside the dirty bounding box, so that is all
+        # that needs copying: one slice for full-width rows, else one per row
+        if self._dirty_bbox is None:
+            return
+        width = config.DISPLAY_WIDTH
+        x0, y0, x1, y1 = self._dirty_bbox
+        back_buffer = self.back_buffer
+        front_buffer = self.front_buffer
+        if x0 == 0 and x1 == width:
+            start = y0 * width * 3
+            end = y1 * width * 3
+            back_buffer[start:end] = front_buffer[start:end]
+            return
+        for y in range(y0, y1):
+            start = (y * width + x0) * 3
+            end = (y * width + x1) * 3
+            back_buffer[start:end] = front_buffer[start:end]
     
     def _swap_buffers(self):
-        """Swap front and back buffers and update only dirty pixels."""
+        """Swap front and back buffers and push the new frame to the hardware."""
+        self._frame_key = None
         if not self.hardware_ready:
-            # In test mode, just swap the buffers
+            # In test mode, just swap the buffers (and carry the new frame forward)
             self.front_buffer, self.back_buffer = self.back_buffer, self.front_buffer
-            self.dirty_pixels.clear()
-            self.dirty_regions.clear()
+            self._carry_dirty_forward()
+            self._reset_dirty()
             return
         
-        # Update only dirty pixels on the hardware
+        width = config.DISPLAY_WIDTH
         updated_pixels = 0
-        for x, y in self.dirty_pixels:
-            if 0 <= x < config.DISPLAY_WIDTH and 0 <= y < config.DISPLAY_HEIGHT:
-                color = self.back_buffer[y][x]
-                self.matrix.SetPixel(x, y, color[0], color[1], color[2])
-                updated_pixels += 1
+        if self.offscreen_canvas is not None:
+            # Push the changed region in one C call and flip it in on the next vsync;
+            # a frame identical to the one on the panel (one memcmp) is not pushed at all
+            # unless update_region asked for it. SwapOnVSync hands back the canvas shown
+            # before, which still lacks the previous frame's changes, so those are
+            # pushed along with this frame's
+            if self._forced_bbox is not None or self.back_buffer != self.front_buffer:
+                changed = self._dirty_bbox or [0, 0, width, config.DISPLAY_HEIGHT]
+                stale = self._canvas_stale_bbox
+                region = changed
+                if stale is not None:
+                    region = [min(changed[0], stale[0]), min(changed[1], stale[1]),
+                              max(changed[2], stale[2]), max(changed[3], stale[3])]
+                self.offscreen_canvas.SetImage(self._buffer_image(self.back_buffer, region), region[0], region[1])
+                self.offscreen_canvas = self.matrix.SwapOnVSync(self.offscreen_canvas)
+                self._canvas_stale_bbox = changed
+                updated_pixels = (region[2] - region[0]) * (region[3] - region[1])
+        elif self._dirty_bbox is not None:
+            # Without PIL, update only pixels that differ from the frame on the panel
+            # (the front buffer). The back buffer starts every frame as a copy of the
+            # front buffer, so changes can only lie inside the dirty bounding box;
+            # each row of it is ruled out with one slice compare before checking
+            # its pixels individually
+            back_buffer = self.back_buffer
+            front_buffer = self.front_buffer
+            set_pixel = self.matrix.SetPixel
+            x0, y0, x1, y1 = self._dirty_bbox
+            for y in range(y0, y1):
+                start = (y * width + x0) * 3
+                end = (y * width + x1) * 3
+                if back_buffer[start:end] == front_buffer[start:end]:
+                    continue
+                for offset in range(start, end, 3):
+                    if back_buffer[offset:offset + 3] != front_buffer[offset:offset + 3]:
+                        set_pixel(offset // 3 - y * width, y, back_buffer[offset], back_buffer[offset + 1], back_buffer[offset + 2])
+                        updated_pixels += 1
+            
+            if self._forced_bbox is not None:
+                # update_region asked for this region whether or not it changed; its
+                # changed pixels went out above, so re-send only the unchanged ones
+                x0, y0, x1, y1 = self._forced_bbox
+                for y in range(y0, y1):
+                    for offset in range((y * width + x0) * 3, (y * width + x1) * 3, 3):
+                        if back_buffer[offset:offset + 3] == front_buffer[offset:offset + 3]:
+                            set_pixel(offset // 3 - y * width, y, back_buffer[offset], back_buffer[offset + 1], back_buffer[offset + 2])
+                            updated_pixels += 1
         
-        # Swap buffers
+        # Swap buffers, then bring the back buffer up to the frame now on the panel
+        # so drawing without clearing first builds on what is shown instead of on
+        # the frame from two swaps ago
         self.front_buffer, self.back_buffer = self.back_buffer, self.front_buffer
+        self._carry_dirty_forward()
         
         # Clear dirty tracking
-        self.dirty_pixels.clear()
-        self.dirty_regions.clear()
+        self._reset_dirty()
         
-        if config.DEBUG_MODE and updated_pixels > 0:
+        if _DEBUG and updated_pixels > 0:
             print(f"Selective update: {updated_pixels} pixels updated")
     
+    def _buffer_image(self, buffer: bytearray, region=None):
+        """
+        Build a PIL image of an RGB framebuffer, or of its [x0, y0, x1, y1) region, for rgbmatrix's SetImage.
+        
+        PIL stores RGB pixels 4 bytes wide, so either way the pixels are copied once
+        into the image; frombuffer cannot share the 3-byte-per-pixel buffer.
+        """
+        width = config.DISPLAY_WIDTH
+        if region is None:
+            return Image.frombuffer('RGB', (width, config.DISPLAY_HEIGHT), buffer, 'raw', 'RGB', 0, 1)
+        x0, y0, x1, y1 = region
+        if x0 == 0 and x1 == width:
+            # Full-width rows are contiguous in the buffer
+            data = buffer[y0 * width * 3:y1 * width * 3]
+        else:
+            data = b''.join(buffer[(y * width + x0) * 3:(y * width + x1) * 3] for y in range(y0, y1))
+        return Image.frombytes('RGB', (x1 - x0, y1 - y0), data)
+    
     def _force_full_update(self):
         """Force a complete display update (useful for initialization)."""
         if not self.hardware_ready:
             return
         
-        for y in range(config.DISPLAY_HEIGHT):
-            for x in range(config.DISPLAY_WIDTH):
-                color = self.back_buffer[y][x]
-                self.matrix.SetPixel(x, y, color[0], color[1], color[2])
+        # The panel no longer shows a show_* screen, so the next one must redraw
+        self._frame_key = None
+        
+        width = config.DISPLAY_WIDTH
+        height = config.DISPLAY_HEIGHT
+        back_buffer = self.back_buffer
+        if PIL_AVAILABLE:
+            # Whole buffer in a single C call
+            self.matrix.SetImage(self._buffer_image(back_buffer), 0, 0)
+        else:
+            set_pixel = self.matrix.SetPixel
+            for y in range(height):
+                for x in range(width):
+                    offset = (y * width + x) * 3
+                    set_pixel(x, y, back_buffer[offset], back_buffer[offset + 1], back_buffer[offset + 2])
+        
+        # The panel now shows the back buffer; record that in the front buffer so the
+        # SetPixel fallback diffs later frames against what is actually displayed,
+        # and push the whole of the next frame to the offscreen canvas, which missed this one
+        self.front_buffer[:] = back_buffer
+        self._canvas_stale_bbox = [0, 0, width, height]
         
-        if config.DEBUG_MODE:
-            print(f"Full update: {config.DISPLAY_WIDTH * config.DISPLAY_HEIGHT} pixels updated")
+        if _DEBUG:
+            print(f"Full update: {width * height} pixels updated")
     
     def show_flight_info(self, flight_data: Dict[str, Any]):
         """
@@ -180,11 +632,6 @@ class DisplayController:
         Args:
             flight_data: Flight data dictionary
         """
-        # Always initialize debug display for testing
-        
-        # Clear the back buffer
-        self._clear_buffer()
-        
         # Extract flight information
         callsign = flight_data.get("callsign", "Unknown")
         route = flight_data.get("route", "")
@@ -192,6 +639,14 @@ class DisplayController:
         origin_code = flight_data.get("origin", "")
         is_private_jet = flight_data.get("is_private_jet", False)
         
+        # Nothing to redraw if this flight is already on the panel
+        frame_key = ("flight", callsign, route, aircraft_type, origin_code, is_private_jet)
+        if frame_key == self._frame_key:
+            return
+        
+        # Clear the back buffer
+        self._clear_buffer()
+        
         # Check if aircraft is Canadian (Canadair RJ series or Bombardier private jet)
         is_canadian_aircraft = (aircraft_type and "Canadair" in aircraft_type) or is_canadian_private_jet(aircraft_type)
         
@@ -202,102 +657,33 @@ class DisplayController:
         
         # Display flight info with different layout for private jets
         try:
+            # Line 1: Aircraft type with Canadian flag if Canadair/Bombardier (y=2, centered horizontally)
+            if aircraft_type:
+                self._draw_centered_text(aircraft_type, 2, purple_color, with_flag=is_canadian_aircraft)
+            
             if is_private_jet:
                 # Private jet display layout
-                # Line 1: Aircraft type with Canadian flag if Bombardier (y=2, centered horizontally)
-                if aircraft_type:
-                    if is_canadian_aircraft:
-                        # Calculate spacing for flag + aircraft type
-                        flag_width = 13  # Canada flag is 13 pixels wide
-                        flag_spacing = 2  # Space between flag and text
-                        aircraft_type_width = len(aircraft_type) * 6  # 6 pixels per character
-                        total_width = flag_width + flag_spacing + aircraft_type_width
-                        
-                        # Center the entire combination
-                        start_x = (config.DISPLAY_WIDTH - total_width) // 2
-                        
-                        # Draw Canadian flag
-                        self._draw_canada_flag(start_x, 2)
-                        
-                        # Draw aircraft type after flag
-                        aircraft_x = start_x + flag_width + flag_spacing
-                        self._draw_text_to_buffer(aircraft_type, aircraft_x, 2, purple_color)
-                    else:
-                        # Normal aircraft type display without flag
-                        aircraft_type_width = len(aircraft_type) * 6  # 6 pixels per character
-                        aircraft_x = (config.DISPLAY_WIDTH - aircraft_type_width) // 2
-                        self._draw_text_to_buffer(aircraft_type, aircraft_x, 2, purple_color)
-                
                 # Line 2: "Look! It's the 1%!" message (y=12, centered horizontally)
-                message = "Look! It's the 1%!"
-                message_width = len(message) * 6  # 6 pixels per character
-                message_x = (config.DISPLAY_WIDTH - message_width) // 2
-                self._draw_text_to_buffer(message, message_x, 12, orange_color)
+                self._draw_centered_text("Look! It's the 1%!", 12, orange_color)
                 
                 # Line 3: Empty (private jets hide route info)
                 
             else:
                 # Regular commercial flight display layout
-                # Line 1: Aircraft type with Canadian flag if Canadair (y=2, centered horizontally)
-                if aircraft_type:
-                    if is_canadian_aircraft:
-                        # Calculate spacing for flag + aircraft type
-                        flag_width = 13  # Canada flag is 13 pixels wide
-                        flag_spacing = 2  # Space between flag and text
-                        aircraft_type_width = len(aircraft_type) * 6  # 6 pixels per character
-                        total_width = flag_width + flag_spacing + aircraft_type_width
-                        
-                        # Center the entire combination
-                        start_x = (config.DISPLAY_WIDTH - total_width) // 2
-                        
-                        # Draw Canadian flag
-                        self._draw_canada_flag(start_x, 2)
-                        
-                        # Draw aircraft type after flag
-                        aircraft_x = start_x + flag_width + flag_spacing
-                        self._draw_text_to_buffer(aircraft_type, aircraft_x, 2, purple_color)
-                    else:
-                        # Normal aircraft type display without flag
-                        aircraft_type_width = len(aircraft_type) * 6  # 6 pixels per character
-                        aircraft_x = (config.DISPLAY_WIDTH - aircraft_type_width) // 2
-                        self._draw_text_to_buffer(aircraft_type, aircraft_x, 2, purple_color)
-                
                 # Line 2: Callsign (y=12, centered horizontally)
-                callsign_width = len(callsign) * 6  # 6 pixels per character
-                callsign_x = (config.DISPLAY_WIDTH - callsign_width) // 2
-                self._draw_text_to_buffer(callsign, callsign_x, 12, orange_color)
+                self._draw_centered_text(callsign, 12, orange_color)
                 
                 # Line 3: Route (y=22, centered horizontally)
                 # Check if origin is Canadian to show flag
                 is_canadian_origin = origin_code in CANADIAN_AIRPORTS
-                
-                if is_canadian_origin:
-                    # Calculate spacing for flag + route
-                    flag_width = 13  # Canada flag is 13 pixels wide
-                    flag_spacing = 2  # Space between flag and text
-                    route_width = len(route) * 6  # 6 pixels per character
-                    total_width = flag_width + flag_spacing + route_width
-                    
-                    # Center the entire combination
-                    start_x = (config.DISPLAY_WIDTH - total_width) // 2
-                    
-                    # Draw Canadian flag
-                    self._draw_canada_flag(start_x, 22)
-                    
-                    # Draw route text after flag
-                    route_x = start_x + flag_width + flag_spacing
-                    self._draw_text_to_buffer(route, route_x, 22, light_blue_color)
-                else:
-                    # Normal route display without flag
-                    route_width = len(route) * 6  # 6 pixels per character
-                    route_x = (config.DISPLAY_WIDTH - route_width) // 2
-                    self._draw_text_to_buffer(route, route_x, 22, light_blue_color)
+                self._draw_centered_text(route, 22, light_blue_color, with_flag=is_canadian_origin)
             
             # Swap buffers to display the new content
             self._swap_buffers()
+            self._frame_key = frame_key
             
             
-            if config.DEBUG_MODE:
+            if _DEBUG:
                 print(f"Displayed flight: {callsign} ({aircraft_type}) - {route}")
                 
         except Exception as e:
@@ -310,16 +696,19 @@ class DisplayController:
         Args:
             weather_data: Weather data dictionary
         """
-        # Always initialize debug display for testing
-        
-        # Clear the back buffer
-        self._clear_buffer()
-        
         # Extract weather information
         arrivals = weather_data.get("arrivals_runway", "Unknown")
         departures = weather_data.get("departures_runway", "Unknown")
         metar = weather_data.get("metar", "Weather unavailable")
         
+        # Only the METAR is drawn; nothing to redraw if it is already on the panel
+        frame_key = ("weather", metar)
+        if frame_key == self._frame_key:
+            return
+        
+        # Clear the back buffer
+        self._clear_buffer()
+        
         try:
             # Layout for 128x32 display with full screen space:
             # Available space: 128x32 (full display)
@@ -331,12 +720,11 @@ class DisplayController:
             
             # Bottom section: Weather icon (18x18) on left + temperature & wind on right
             # Draw weather icon starting at y=12 (lines 2&3 combined)
-            weather_condition = self._parse_weather_condition(metar)
+            # (the METAR is parsed once and cached, since it only changes about hourly)
+            weather_condition, temperature, wind_info = _parse_metar(metar)
             self._draw_weather_icon_to_buffer(weather_condition, 1, 12)
             
             # Draw temperature and wind on same line to the right of the icon
-            temperature = self._extract_temperature_from_metar(metar)
-            wind_info = self._extract_wind_from_metar(metar)
             
             # Combine temperature and wind on same line
             temp_text = temperature if temperature else "Temp: N/A"
@@ -349,9 +737,10 @@ class DisplayController:
             
             # Swap buffers to display the new content
             self._swap_buffers()
+            self._frame_key = frame_key
             
             
-            if config.DEBUG_MODE:
+            if _DEBUG:
                 print(f"Displayed weather: ARR={arrivals}, DEP={departures}, Temp={temperature if temperature else 'N/A'}")
                 
         except Exception as e:
@@ -359,25 +748,34 @@ class DisplayController:
     
     def show_no_flights_message(self, message_data: Dict[str, Any]):
         """Display message when no flights detected using double buffering."""
-        # Always initialize debug display for testing
-        
-        # Clear the back buffer
-        self._clear_buffer()
+        # The message never changes, so there is nothing to redraw if it is already shown
+        if self._frame_key == ("no_flights",):
+            return
         
         try:
             # Available space: 128x32 (full display)
             # Text positions with proper spacing
             
-            # Display "no flights" message with full screen space
-            self._draw_text_to_buffer("No Approach", 1, 2, config.ROW_ONE_COLOR)
-            self._draw_text_to_buffer("Traffic", 1, 12, config.ROW_TWO_COLOR)
-            self._draw_text_to_buffer("Detected", 1, 22, config.ROW_THREE_COLOR)
+            # Display "no flights" message with full screen space; the screen never
+            # changes, so it is rendered once and copied in on later calls
+            if self._no_flights_frame is None:
+                # Clear the back buffer
+                self._clear_buffer()
+                self._draw_text_to_buffer("No Approach", 1, 2, config.ROW_ONE_COLOR)
+                self._draw_text_to_buffer("Traffic", 1, 12, config.ROW_TWO_COLOR)
+                self._draw_text_to_buffer("Detected", 1, 22, config.ROW_THREE_COLOR)
+                self._no_flights_frame = bytes(self.back_buffer)
+            else:
+                # The cached frame covers the whole screen, so no clear is needed first
+                self.back_buffer[:] = self._no_flights_frame
+                self._mark_all_dirty()
             
             # Swap buffers to display the new content
             self._swap_buffers()
+            self._frame_key = ("no_flights",)
             
             
-            if config.DEBUG_MODE:
+            if _DEBUG:
                 print("Displayed: No Approach Traffic Detected")
                 
         except Exception as e:
@@ -435,66 +833,89 @@ class DisplayController:
         plane_color = (128, 0, 128)  # Purple color
         center_y = config.DISPLAY_HEIGHT // 2  # Center row
         
-        # 10x10 plane pattern designed by user
-        plane_pattern = [
-            "          ",
-            "      PP  ",
-            "    PPP   ",
-            "  PPP   PP",
-            "PPPPPPPPPP",
-            "PPPPPPPPPP",
-            "  PPP   PP",
-            "    PPP   ",
-            "      PP  ",
-            "          "
-        ]
+        width = config.DISPLAY_WIDTH
+        height = config.DISPLAY_HEIGHT
+        
+        # Render the plane once as RGB byte rows; the buffer is cleared to black
+        # every frame, so the blank cells can be copied along with the lit ones
+        plane_width = len(_PLANE_PATTERN[0])
+        pixel_bytes = {'P': bytes(plane_color), ' ': bytes(3)}
+        plane_rows = [b''.join(pixel_bytes[char] for char in line) for line in _PLANE_PATTERN]
+        top = center_y - 5
+        rows = [(top + row, plane_rows[row]) for row in range(len(plane_rows)) if 0 <= top + row < height]
         
         # Start from right edge, move to left edge
-        start_x = config.DISPLAY_WIDTH
-        end_x = -10  # Plane width (now 10 pixels wide)
+        start_x = width
+        end_x = -plane_width  # Plane width (now 10 pixels wide)
+        
+        # Pace frames against a fixed 1/120 s schedule on every path. SwapOnVSync
+        # only caps the rate at the panel refresh; on a faster panel the plane
+        # would otherwise cross quicker than intended
+        frame_interval = 1.0 / 120.0
+        next_frame = time.perf_counter()
         
         for x in range(start_x, end_x, -1):
             # Clear buffer
             self._clear_buffer()
             
-            # Draw plane at current position (centered vertically)
-            self._draw_plane_to_buffer(plane_pattern, x, center_y - 5, plane_color)
+            # Copy the visible columns of each plane row into place as one slice
+            x0, x1 = max(x, 0), min(x + plane_width, width)
+            if x0 < x1:
+                back_buffer = self.back_buffer
+                src_start, src_end = (x0 - x) * 3, (x1 - x) * 3
+                for y, row_bytes in rows:
+                    offset = (y * width + x0) * 3
+                    back_buffer[offset:offset + src_end - src_start] = row_bytes[src_start:src_end]
             
             # Update display
             self._swap_buffers()
             
-            # Back to fast animation speed (0.1ms per tick)
-            time.sleep(0.0001)  # 0.1 milliseconds
+            # Sleep off whatever is left of this frame; skip it when running behind
+            next_frame += frame_interval
+            delay = next_frame - time.perf_counter()
+            if delay > 0.0005:
+                time.sleep(delay)
     
-    def _draw_plane_to_buffer(self, pattern: list, x: int, y: int, color: tuple):
-        """Draw a plane pattern to the back buffer."""
-        for row, line in enumerate(pattern):
-            for col, char in enumerate(line):
-                if char == 'P':
-                    pixel_x = x + col
-                    pixel_y = y + row
-                    if 0 <= pixel_x < config.DISPLAY_WIDTH and 0 <= pixel_y < config.DISPLAY_HEIGHT:
-                        self._set_pixel_buffer(pixel_x, pixel_y, color)
+    def _draw_plane_to_buffer(self, x: int, y: int, color: tuple):
+        """Draw the plane pattern to the back buffer."""
+        self._blit_sprite(_plane_sprite(color), x, y)
+    
+    def _blit_sprite(self, sprite: tuple, x: int, y: int):
+        """Draw a compiled sprite to the back buffer, clipped to the display."""
+        sprite_width, sprite_height, runs, spans = sprite
+        width = config.DISPLAY_WIDTH
+        
+        # Work out the visible part of the sprite once; nothing to do if it is all off screen
+        col_lo, col_hi = max(0, -x), min(sprite_width, width - x)
+        row_lo, row_hi = max(0, -y), min(sprite_height, config.DISPLAY_HEIGHT - y)
+        if col_lo >= col_hi or row_lo >= row_hi:
+            return
+        self._add_dirty_region(x + col_lo, y + row_lo, col_hi - col_lo, row_hi - row_lo)
+        back_buffer = self.back_buffer
+        
+        if col_lo == 0 and row_lo == 0 and col_hi == sprite_width and row_hi == sprite_height:
+            # Whole sprite on screen: each run is a precomputed offset and fill, no clipping
+            base = (y * width + x) * 3
+            for offset, fill in spans:
+                start = base + offset
+                back_buffer[start:start + len(fill)] = fill
+            return
+        
+        # Partly off screen: write each visible run of same-colored pixels as one slice
+        for col, row, length, pixel in runs:
+            if not row_lo <= row < row_hi:
+                continue
+            start, end = max(col, col_lo), min(col + length, col_hi)
+            if start < end:
+                offset = ((y + row) * width + x + start) * 3
+                back_buffer[offset:offset + (end - start) * 3] = pixel * (end - start)
     
     def _draw_static_plane_icon(self, x: int, y: int):
         """Draw the static plane icon used in flight info display."""
         plane_color = (128, 0, 128)  # Purple color
         
         # Same 10x10 plane pattern as animation
-        plane_pattern = [
-            "          ",
-            "      PP  ",
-            "    PPP   ",
-            "  PPP   PP",
-            "PPPPPPPPPP",
-            "PPPPPPPPPP",
-            "  PPP   PP",
-            "    PPP   ",
-            "      PP  ",
-            "          "
-        ]
-        
-        self._draw_plane_to_buffer(plane_pattern, x, y, plane_color)
+        self._draw_plane_to_buffer(x, y, plane_color)
     
     def clear_display(self):
         """Clear the LED matrix display using double buffering."""
@@ -503,6 +924,13 @@ class DisplayController:
     
     
     
+    def _draw_centered_text(self, text: str, y: int, color: tuple, with_flag: bool = False):
+        """Draw a line of text centered horizontally, optionally preceded by a Canada flag."""
+        flag_x, text_x = _centered_layout(len(text), with_flag)
+        if with_flag:
+            self._draw_canada_flag(flag_x, y)
+        self._draw_text_to_buffer(text, text_x, y, color)
+    
     def _draw_text(self, text: str, x: int, y: int, color: tuple):
         """
         Draw text on the LED matrix using simple pixel patterns (legacy method).
@@ -526,89 +954,40 @@ class DisplayController:
             y: Y position
             color: RGB color tuple
         """
-        # Improved 5x8 font patterns for better readability
-        patterns = {
-            '0': [0b11111, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b11111],
-            '1': [0b00100, 0b01100, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b11111],
-            '2': [0b11111, 0b00001, 0b00001, 0b11111, 0b10000, 0b10000, 0b10000, 0b11111],
-            '3': [0b11111, 0b00001, 0b00001, 0b11111, 0b00001, 0b00001, 0b00001, 0b11111],
-            '4': [0b10001, 0b10001, 0b10001, 0b11111, 0b00001, 0b00001, 0b00001, 0b00001],
-            '5': [0b11111, 0b10000, 0b10000, 0b11111, 0b00001, 0b00001, 0b00001, 0b11111],
-            '6': [0b11111, 0b10000, 0b10000, 0b11111, 0b10001, 0b10001, 0b10001, 0b11111],
-            '7': [0b11111, 0b00001, 0b00001, 0b00010, 0b00100, 0b01000, 0b01000, 0b01000],
-            '8': [0b11111, 0b10001, 0b10001, 0b11111, 0b10001, 0b10001, 0b10001, 0b11111],
-            '9': [0b11111, 0b10001, 0b10001, 0b11111, 0b00001, 0b00001, 0b00001, 0b11111],
-            'A': [0b11111, 0b10001, 0b10001, 0b11111, 0b10001, 0b10001, 0b10001, 0b10001],
-            'B': [0b11110, 0b10001, 0b10001, 0b11110, 0b10001, 0b10001, 0b10001, 0b11110],
-            'C': [0b11111, 0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b11111],
-            'D': [0b11110, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b11110],
-            'E': [0b11111, 0b10000, 0b10000, 0b11111, 0b10000, 0b10000, 0b10000, 0b11111],
-            'F': [0b11111, 0b10000, 0b10000, 0b11111, 0b10000, 0b10000, 0b10000, 0b10000],
-            'G': [0b11111, 0b10000, 0b10000, 0b10111, 0b10001, 0b10001, 0b10001, 0b11111],
-            'H': [0b10001, 0b10001, 0b10001, 0b11111, 0b10001, 0b10001, 0b10001, 0b10001],
-            'I': [0b11111, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b11111],
-            'J': [0b11111, 0b00001, 0b00001, 0b00001, 0b00001, 0b10001, 0b10001, 0b11111],
-            'K': [0b10001, 0b10010, 0b10100, 0b11000, 0b10100, 0b10010, 0b10001, 0b10001],
-            'L': [0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b11111],
-            'M': [0b10001, 0b11011, 0b10101, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001],
-            'N': [0b10001, 0b11001, 0b10101, 0b10101, 0b10011, 0b10001, 0b10001, 0b10001],
-            'O': [0b11111, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b11111],
-            'P': [0b11111, 0b10001, 0b10001, 0b11111, 0b10000, 0b10000, 0b10000, 0b10000],
-            'Q': [0b11111, 0b10001, 0b10001, 0b10001, 0b10101, 0b10011, 0b10001, 0b11111],
-            'R': [0b11111, 0b10001, 0b10001, 0b11111, 0b10100, 0b10010, 0b10001, 0b10001],
-            'S': [0b11111, 0b10000, 0b10000, 0b11111, 0b00001, 0b00001, 0b00001, 0b11111],
-            'T': [0b11111, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100],
-            'U': [0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b11111],
-            'V': [0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b01010, 0b01010, 0b00100],
-            'W': [0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b10101, 0b11011, 0b10001],
-            'X': [0b10001, 0b10001, 0b01010, 0b00100, 0b01010, 0b10001, 0b10001, 0b10001],
-            'Y': [0b10001, 0b10001, 0b01010, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100],
-            'Z': [0b11111, 0b00001, 0b00010, 0b00100, 0b01000, 0b10000, 0b10000, 0b11111],
-            ' ': [0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000],
-            ':': [0b00000, 0b00100, 0b00100, 0b00000, 0b00000, 0b00100, 0b00100, 0b00000],
-            '-': [0b00000, 0b00000, 0b00000, 0b11111, 0b00000, 0b00000, 0b00000, 0b00000],
-            '→': [0b00000, 0b00100, 0b00010, 0b11111, 0b00010, 0b00100, 0b00000, 0b00000],
-            '.': [0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00100, 0b00100],
-            '@': [0b11111, 0b10001, 0b10101, 0b10111, 0b10110, 0b10000, 0b10000, 0b11111],
-            '/': [0b00001, 0b00001, 0b00010, 0b00100, 0b01000, 0b10000, 0b10000, 0b10000],
-            '°': [0b01110, 0b10001, 0b10001, 0b01110, 0b00000, 0b00000, 0b00000, 0b00000],
-            '!': [0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b00000, 0b00000, 0b00100],
-            "'": [0b00100, 0b00100, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000],
-            '%': [0b00000000, 0b00000000, 0b01100100, 0b01101000, 0b00010000, 0b00100000, 0b01001100, 0b10001100],
-        }
+        # Glyph runs for the whole string come from the layout cache
+        text_width, runs, spans = _text_layout(text)
         
         # Calculate text bounding box for dirty region tracking
-        # Account for wider % character (8+1 pixels vs 5+1 pixels)
-        text_width = 0
-        for char in text.upper():
-            if char == '%':
-                text_width += 9  # 8 pixels + 1 space
-            else:
-                text_width += 6  # 5 pixels + 1 space
-        text_height = 8  # Font height
+        text_height = _FONT_HEIGHT
         self._add_dirty_region(x, y, text_width, text_height)
         
-        char_x = x
-        for char in text.upper():
-            if char in patterns:
-                pattern = patterns[char]
-                if char == '%':
-                    # Special handling for % character (8x8)
-                    for row in range(8):  # 8 rows
-                        for col in range(8):  # 8 columns for % character
-                            if pattern[row] & (1 << (7-col)):  # Check from bit 7 to 0
-                                self._set_pixel_buffer(char_x + col, y + row, color)
-                    char_x += 9  # Move to next character position (8 pixels + 1 space)
-                else:
-                    # Standard 5x8 character handling
-                    for row in range(8):  # 8 rows for new font
-                        for col in range(5):  # 5 columns for new font
-                            if pattern[row] & (1 << (4-col)):  # Check from bit 4 to 0
-                                self._set_pixel_buffer(char_x + col, y + row, color)
-                    char_x += 6  # Move to next character position (5 pixels + 1 space)
-            else:
-                # Unknown character, skip
-                char_x += 6
+        # Write each horizontal run of lit pixels as one slice
+        # (the bounding box above already marked these pixels dirty)
+        width = config.DISPLAY_WIDTH
+        height = config.DISPLAY_HEIGHT
+        back_buffer = self.back_buffer
+        pixel = bytes(color)
+        fills = [pixel * length for length in range(9)]  # Glyph runs are at most 8 pixels long
+        
+        if x >= 0 and y >= 0 and x + text_width <= width + 1 and y + text_height <= height:
+            # Whole string on screen (the last advance may hang 1 pixel of spacing off
+            # the edge): no clipping, each run is a precomputed offset from the string origin
+            base = (y * width + x) * 3
+            for offset, length in spans:
+                start = base + offset
+                back_buffer[start:start + length * 3] = fills[length]
+            return
+        
+        # Partly off screen: clip every run to the display
+        for col, row, length in runs:
+            pixel_y = y + row
+            if not 0 <= pixel_y < height:
+                continue
+            x0 = max(x + col, 0)
+            x1 = min(x + col + length, width)
+            if x0 < x1:
+                offset = (pixel_y * width + x0) * 3
+                back_buffer[offset:offset + (x1 - x0) * 3] = fills[x1 - x0]
     
     
     
@@ -616,71 +995,15 @@ class DisplayController:
     
     def _extract_temperature_from_metar(self, metar: str) -> str:
         """Extract temperature information from METAR string."""
-        if not metar:
-            return None
-        
-        try:
-            # Look for temperature/dewpoint pattern like "29/22"
-            temp_match = re.search(r'(\d+)/(\d+)', metar)
-            if temp_match:
-                temp = temp_match.group(1)
-                return f"{temp}°C"
-            else:
-                return None
-        except Exception:
-            return None
+        return _metar_temperature(metar)
     
     def _extract_wind_from_metar(self, metar: str) -> str:
         """Extract wind information from METAR string."""
-        if not metar:
-            return None
-        
-        try:
-            # Look for wind pattern like "18006KT" or "25009G19KT" (with optional gusts)
-            wind_match = re.search(r'(\d{3})(\d{2,3})(?:G(\d{2,3}))?KT', metar)
-            if wind_match:
-                direction = wind_match.group(1)
-                speed = wind_match.group(2).lstrip('0') or '0'
-                gust = wind_match.group(3)
-                
-                if gust:
-                    gust = gust.lstrip('0') or '0'
-                    return f"{direction}@{speed}G{gust}kt"
-                else:
-                    return f"{direction}@{speed}kt"
-            else:
-                return None
-        except Exception:
-            return None
-    
-    
-    
-    
+        return _metar_wind(metar)
     
-    
-    
-    
-    
-    
-    
-
     def _parse_weather_condition(self, metar: str) -> str:
         """Parse weather condition from METAR string - simplified to 3 categories."""
-        if not metar:
-            return "cloudy"
-        
-        metar_upper = metar.upper()
-        
-        # Check for any precipitation (rain, snow, storms)
-        if any(precip in metar_upper for precip in ['RA', 'SHRA', 'TSRA', 'DZ', 'SN', 'SHSN', 'BLSN', 'TS', 'VCTS']):
-            return "rainy"
-        
-        # Check for clear/sunny conditions
-        elif 'CLR' in metar_upper or 'SKC' in metar_upper:
-            return "sunny"
-        
-        # Everything else defaults to cloudy (overcast/cloudy conditions)
-        return "cloudy"
+        return _metar_condition(metar)
     
     def _draw_weather_icon(self, condition: str, x: int, y: int):
         """Draw emoji-like weather icons on the LED matrix (legacy method)."""
@@ -689,98 +1012,11 @@ class DisplayController:
         
     def _draw_weather_icon_to_buffer(self, condition: str, x: int, y: int):
         """Draw emoji-like weather icons to the back buffer."""
-        
-        # 18x18 pixel weather icons
-        simple_icons = {
-            "sunny": [
-                "                  ",  # Row 0 - Empty
-                " s      s      s  ",  # Row 1 - Top ray
-                "  s     s     s   ",  # Row 2 - Diagonal rays
-                "   s    s    s    ",  # Row 3 - Diagonal rays
-                "                  ",  # Row 4 - Empty
-                "     sssssss      ",  # Row 5 - Top of circle
-                "    sssssssss     ",  # Row 6 - Circle sides
-                "    sssssssss     ",  # Row 7 - Circle
-                "    sssssssss     ",  # Row 8 - Circle
-                "sss sssssssss  sss",  # Row 9 - Circle + left/right rays
-                "    sssssssss     ",  # Row 10 - Circle
-                "    sssssssss     ",  # Row 11 - Circle
-                "    sssssssss     ",  # Row 12 - Circle sides
-                "     sssssss      ",  # Row 13 - Bottom of circle
-                "                  ",  # Row 17 - Empty
-                "    s   s   s     ",  # Row 14 - Diagonal rays
-                "   s    s    s    ",  # Row 15 - Diagonal rays
-                "  s     s     s   ",  # Row 16 - Diagonal rays
-                
-            ],
-            "cloudy": [
-                "                  ",
-                "                  ",
-                "  ~~~~~~~~~~~~~~  ",
-                "                  ",
-                "                  ",
-                "~~~~~~~~~~~~      ",
-                "                  ",
-                "                  ",
-                "      ~~~~~~~~~~  ",
-                "                  ",
-                "                  ",
-                "  ~~~~~~~~~~~~~~  ",
-                "                  ",
-                "                  ",
-                "~~~~~~~~~~        ",
-                "                  ",
-                "                  ",
-                "                  "
-            ],
-            "rainy": [
-                "                  ",  # Row 0 - Empty
-                "                  ",  # Row 1 - Empty
-                "                  ",  # Row 1 - Empty
-                "        o         ",  # Row 2 - Single point at top
-                "       ooo        ",  # Row 3 - Start widening
-                "      ooooo       ",  # Row 4 - Wider
-                "     ooooooo      ",  # Row 5 - Wider
-                "    ooooooooo     ",  # Row 6 - Wider
-                "   ooooooooooo    ",  # Row 7 - Wider
-                "  ooooooooooooo   ",  # Row 8 - Wider
-                "  ooooooooooooo   ",  # Row 9 - Widest part (13 pixels)
-                "  ooooooooooooo   ",  # Row 10 - Widest part (13 pixels)
-                "   ooooooooooo    ",  # Row 11 - Widest part (13 pixels)
-                "    ooooooooo     ",  # Row 12 - Start rounding (11 pixels)
-                "     ooooooo      ",  # Row 13 - More rounded (9 pixels)
-                "                  ",  # Row 15 - Rounded bottom (5 pixels)
-                "                  ",  # Row 16 - Rounded bottom (3 pixels)
-                "                  ",  # Row 17 - Empty
-            ]
-        }
-        
-        if condition not in simple_icons:
+        if condition not in _WEATHER_ICON_SPRITES:
             condition = "cloudy"
         
-        icon = simple_icons[condition]
-        
-        # Color mapping for weather elements
-        colors = {
-            's': (255, 200, 0),     # Yellow/orange (sun)
-            'o': (0, 100, 255),     # Blue (rain drop)
-            '~': (255, 255, 255),   # White (cloud lines)
-            ' ': None               # Transparent
-        }
-        
-        # Add dirty region for the entire icon
-        self._add_dirty_region(x, y, 18, 18)
-        
-        for row, line in enumerate(icon):
-            for col, char in enumerate(line):
-                if char in colors and colors[char]:
-                    color = colors[char]
-                    pixel_x = x + col
-                    pixel_y = y + row
-                    
-                    # Make sure we don't go outside display bounds
-                    if pixel_x < config.DISPLAY_WIDTH and pixel_y < config.DISPLAY_HEIGHT:
-                        self._set_pixel_buffer(pixel_x, pixel_y, color)
+        # 18x18 pixel weather icons
+        self._blit_sprite(_WEATHER_ICON_SPRITES[condition], x, y)
 
     def set_pixel(self, x: int, y: int, color: tuple):
         """Set a single pixel (public API for external use)."""
@@ -789,16 +1025,35 @@ class DisplayController:
     def get_pixel(self, x: int, y: int) -> tuple:
         """Get the color of a pixel from the front buffer."""
         if 0 <= x < config.DISPLAY_WIDTH and 0 <= y < config.DISPLAY_HEIGHT:
-            return self.front_buffer[y][x]
+            offset = (y * config.DISPLAY_WIDTH + x) * 3
+            return tuple(self.front_buffer[offset:offset + 3])
         return (0, 0, 0)
     
     def update_region(self, x: int, y: int, width: int, height: int):
-        """Force update of a specific region on the next buffer swap."""
-        self._add_dirty_region(x, y, width, height)
+        """Force update of a specific region on the next buffer swap, even where its pixels are unchanged."""
+        x0, x1 = max(x, 0), min(x + width, config.DISPLAY_WIDTH)
+        y0, y1 = max(y, 0), min(y + height, config.DISPLAY_HEIGHT)
+        if x0 >= x1 or y0 >= y1:
+            return
+        self._extend_dirty_bbox(x0, y0, x1, y1)
+        forced = self._forced_bbox
+        if forced is None:
+            self._forced_bbox = [x0, y0, x1, y1]
+        else:
+            self._forced_bbox = [min(forced[0], x0), min(forced[1], y0), max(forced[2], x1), max(forced[3], y1)]
     
     def get_dirty_pixel_count(self) -> int:
-        """Get the number of pixels that need updating."""
-        return len(self.dirty_pixels)
+        """Get the number of pixels that need updating (the area of the dirty bounding box)."""
+        if self._dirty_bbox is None:
+            return 0
+        x0, y0, x1, y1 = self._dirty_bbox
+        return (x1 - x0) * (y1 - y0)
+    
+    def get_dirty_bbox(self) -> Optional[tuple]:
+        """Get the (x0, y0, x1, y1) bounds of the pixels that need updating, or None if nothing is dirty."""
+        if self._dirty_bbox is None:
+            return None
+        return tuple(self._dirty_bbox)
     
     def is_hardware_ready(self) -> bool:
         """Check if hardware is ready for display operations."""
@@ -810,6 +1065,30 @@ class DisplayController:
     
     def draw_line(self, x1: int, y1: int, x2: int, y2: int, color: tuple):
         """Draw a line between two points."""
+        display_width = config.DISPLAY_WIDTH
+        display_height = config.DISPLAY_HEIGHT
+        
+        if y1 == y2:
+            # Horizontal: one slice of the row, clipped to the display
+            x0, x_end = max(min(x1, x2), 0), min(max(x1, x2) + 1, display_width)
+            if 0 <= y1 < display_height and x0 < x_end:
+                offset = (y1 * display_width + x0) * 3
+                self.back_buffer[offset:offset + (x_end - x0) * 3] = bytes(color) * (x_end - x0)
+                self._add_dirty_region(x0, y1, x_end - x0, 1)
+            return
+        
+        if x1 == x2:
+            # Vertical: one strided slice per color channel, stepping a row at a time
+            y0, y_end = max(min(y1, y2), 0), min(max(y1, y2) + 1, display_height)
+            if 0 <= x1 < display_width and y0 < y_end:
+                count = y_end - y0
+                start = (y0 * display_width + x1) * 3
+                stop = start + (count - 1) * display_width * 3 + 1
+                for channel in range(3):
+                    self.back_buffer[start + channel:stop + channel:display_width * 3] = bytes((color[channel],)) * count
+                self._add_dirty_region(x1, y0, 1, count)
+            return
+        
         # Bresenham's line algorithm
         dx = abs(x2 - x1)
         dy = abs(y2 - y1)
@@ -817,9 +1096,23 @@ class DisplayController:
         sy = 1 if y1 < y2 else -1
         err = dx - dy
         
+        # Every plotted pixel lies inside the line's clipped bounding box
+        bbox_x0, bbox_x1 = max(min(x1, x2), 0), min(max(x1, x2) + 1, display_width)
+        bbox_y0, bbox_y1 = max(min(y1, y2), 0), min(max(y1, y2) + 1, display_height)
+        if bbox_x0 < bbox_x1 and bbox_y0 < bbox_y1:
+            self._extend_dirty_bbox(bbox_x0, bbox_y0, bbox_x1, bbox_y1)
+        
+        # The pixel store is inlined so the loop is plain integer arithmetic
+        back_buffer = self.back_buffer
+        red, green, blue = color[0], color[1], color[2]
+        
         x, y = x1, y1
         while True:
-            self._set_pixel_buffer(x, y, color)
+            if 0 <= x < display_width and 0 <= y < display_height:
+                offset = (y * display_width + x) * 3
+                back_buffer[offset] = red
+                back_buffer[offset + 1] = green
+                back_buffer[offset + 2] = blue
             
             if x == x2 and y == y2:
                 break
@@ -835,59 +1128,32 @@ class DisplayController:
     def draw_rectangle(self, x: int, y: int, width: int, height: int, color: tuple, filled: bool = False):
         """Draw a rectangle."""
         if filled:
-            for dy in range(height):
-                for dx in range(width):
-                    self._set_pixel_buffer(x + dx, y + dy, color)
+            # Clip once, then fill each row of the rectangle with a single slice
+            display_width = config.DISPLAY_WIDTH
+            x0, x1 = max(x, 0), min(x + width, display_width)
+            y0, y1 = max(y, 0), min(y + height, config.DISPLAY_HEIGHT)
+            if x0 < x1:
+                back_buffer = self.back_buffer
+                row_fill = bytes(color) * (x1 - x0)
+                for row in range(y0, y1):
+                    offset = (row * display_width + x0) * 3
+                    back_buffer[offset:offset + len(row_fill)] = row_fill
         else:
-            # Draw rectangle outline
-            for dx in range(width):
-                self._set_pixel_buffer(x + dx, y, color)  # Top
-                self._set_pixel_buffer(x + dx, y + height - 1, color)  # Bottom
-            for dy in range(height):
-                self._set_pixel_buffer(x, y + dy, color)  # Left
-                self._set_pixel_buffer(x + width - 1, y + dy, color)  # Right
+            # Draw rectangle outline as four edges, each a slice write in draw_line
+            bottom = y + height - 1
+            right = x + width - 1
+            if width > 0:
+                self.draw_line(x, y, right, y, color)  # Top
+                self.draw_line(x, bottom, right, bottom, color)  # Bottom
+            if height > 0:
+                self.draw_line(x, y, x, bottom, color)  # Left
+                self.draw_line(right, y, right, bottom, color)  # Right
         
         self._add_dirty_region(x, y, width, height)
     
     def _draw_canada_flag(self, x: int, y: int):
         """Draw a small Canada flag icon (13x8 pixels)."""
-        # 13x8 pixel Canada flag pattern
-        # R = Red, W = White, . = transparent
-        flag_pattern = [
-            "RRR.......RRR",  # Row 0
-            "RRR...R...RRR",  # Row 1 - start of maple leaf
-            "RRR.R.R.R.RRR",  # Row 2 - maple leaf
-            "RRR.RRRRR.RRR",  # Row 3 - maple leaf center
-            "RRR..RRR..RRR",  # Row 4 - maple leaf
-            "RRR.R.R.R.RRR",  # Row 5 - maple leaf stem
-            "RRR...R...RRR",  # Row 6 - maple leaf stem
-            "RRR.......RRR",  # Row 7
-        ]
-        
-        # Color mapping
-        colors = {
-            'R': (255, 0, 0),      # Red
-            'W': (255, 255, 255),  # White
-            '.': None              # Transparent (don't draw)
-        }
-        
-        # Add dirty region for the entire flag
-        self._add_dirty_region(x, y, 13, 8)
-        
-        for row, line in enumerate(flag_pattern):
-            for col, char in enumerate(line):
-                if char == 'R':
-                    # Draw red pixels
-                    pixel_x = x + col
-                    pixel_y = y + row
-                    if pixel_x < config.DISPLAY_WIDTH and pixel_y < config.DISPLAY_HEIGHT:
-                        self._set_pixel_buffer(pixel_x, pixel_y, colors['R'])
-                elif char == 'W':
-                    # Draw white pixels
-                    pixel_x = x + col
-                    pixel_y = y + row
-                    if pixel_x < config.DISPLAY_WIDTH and pixel_y < config.DISPLAY_HEIGHT:
-                        self._set_pixel_buffer(pixel_x, pixel_y, colors['W'])
+        self._blit_sprite(_CANADA_FLAG_SPRITE, x, y)
 
 # Global instance for easy access
 display_controller = DisplayController()
\ No newline at end of file
@@ -55,7 +55,7 @@ def get_env_var(key, default=None, env_vars=None):
     Args:
         key: Environment variable name
         default: Default value if not found
-        env_vars: Pre-loaded env vars dict (optional)
+        env_vars: Pre-loaded env vars dict (optional, defaults to the cached .env contents)
         
     Returns:
         str: Environment variable value or default
@@ -65,16 +65,32 @@ def get_env_var(key, default=None, env_vars=None):
     if value is not None:
         return value
     
-    # Then try .env file
+    # Then try .env file (parsed once and shared across calls)
     if env_vars is None:
-        env_vars = load_env_file()
+        env_vars = get_cached_env()
     
     return env_vars.get(key, default)
 
+# Accepted spellings for a true boolean value (compared case-insensitively)
+_TRUTHY_VALUES = frozenset(('true', '1', 'yes', 'on'))
+_TRUTHY_BYTES = frozenset(value.encode() for value in _TRUTHY_VALUES)
+
 def get_bool_env(key, default=False, env_vars=None):
     """Get a boolean environment variable."""
-    value = get_env_var(key, str(default).lower(), env_vars)
-    return value.lower() in ('true', '1', 'yes', 'on')
+    # On POSIX, compare the raw bytes so the value never needs decoding to str
+    environb = getattr(os, 'environb', None)
+    if environb is not None:
+        raw = environb.get(key.encode())
+        if raw is not None:
+            return raw in _TRUTHY_BYTES or raw.lower() in _TRUTHY_BYTES
+        # Not in the process environment, so skip straight to the .env file
+        if env_vars is None:
+            env_vars = get_cached_env()
+        value = env_vars.get(key, str(default).lower())
+    else:
+        value = get_env_var(key, str(default).lower(), env_vars)
+    # Common lowercase values hit directly; only mixed-case input pays for .lower()
+    return value in _TRUTHY_VALUES or value.lower() in _TRUTHY_VALUES
 
 # Global env vars cache for efficiency
 _env_cache = None
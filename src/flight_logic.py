@@ -126,7 +126,7 @@ AIRPORT_CODES = {
 }
 
 # Canadian airports
-CANADIAN_AIRPORTS = {"YYZ", "YUL", "YVR"}
+CANADIAN_AIRPORTS = frozenset({"YYZ", "YUL", "YVR"})
 
 def extract_airline_code(callsign: str) -> Optional[str]:
     """Extract airline code from callsign (e.g., 'EDV5361' -> 'EDV')."""
@@ -263,6 +263,9 @@ PRIVATE_JET_CODES = {
 # Canadian private jet manufacturers
 CANADIAN_PRIVATE_JET_MANUFACTURERS = ["Bombardier"]
 
+# L/C/R suffix on a runway designator like "04L"
+_RUNWAY_SUFFIX_RE = re.compile(r'[LCR]$')
+
 def get_aircraft_type_name(aircraft_code: str) -> str:
     """Get aircraft type name from code, or return original if not found."""
     if aircraft_code in AIRCRAFT_TYPES:
@@ -290,6 +293,9 @@ class FlightLogic:
     def __init__(self):
         # FlightRadar24 API endpoints
         self.flight_search_url = f"https://data-cloud.flightradar24.com/zones/fcgi/feed.js?bounds={config.BOUNDS_BOX}{config.FLIGHT_SEARCH_TAIL}"
+        
+        # URL and headers never change, so build the request once and reuse it every poll
+        self.flight_search_request = urllib.request.Request(self.flight_search_url, headers=config.REQUEST_HEADERS)
     
     def check_runway_status(self) -> Dict[str, Any]:
         """
@@ -310,7 +316,7 @@ class FlightLogic:
             runway_04_active = False
             if arrivals:
                 # Remove L/C/R suffixes and check if it's runway 04
-                runway_num = re.sub(r'[LCR]$', '', arrivals)
+                runway_num = _RUNWAY_SUFFIX_RE.sub('', arrivals)
                 runway_04_active = runway_num in ['04', '4']
             
             return {
@@ -337,10 +343,7 @@ class FlightLogic:
             dict: Flight data or None if no flights found
         """
         try:
-            # Create request with headers
-            request = urllib.request.Request(self.flight_search_url, headers=config.REQUEST_HEADERS)
-            
-            with urllib.request.urlopen(request, timeout=config.CONNECTION_TIMEOUT) as response:
+            with urllib.request.urlopen(self.flight_search_request, timeout=config.CONNECTION_TIMEOUT) as response:
                 if response.getcode() != 200:
                     print(f"FlightRadar24 API returned status {response.getcode()}")
                     return None
@@ -13,6 +13,17 @@ from typing import Optional, Dict, Any
 ATIS_URL = "https://datis.clowd.io/api/KLGA"
 METAR_URL = "https://aviationweather.gov/api/data/metar?ids=KLGA&format=json"
 
+# ATIS runway patterns, compiled once
+# Landing patterns are tried in order: explicit landing runway first, then a
+# runway with an approach in use (which implies landing on that runway)
+_LANDING_RUNWAY_PATTERNS = (
+    re.compile(r'LND\s+RW?Y\s+(\d+[LCR]?)'),  # "LND RY XX" or "LND RWY XX"
+    re.compile(r'LANDING\s+RW?Y\s+(\d+[LCR]?)'),  # "LANDING RUNWAY XX" or "LANDING RY XX"
+    re.compile(r'ILS\s+RW?Y\s+(\d+[LCR]?)\s+APCH\s+IN\s+USE'),  # "ILS RY XX APCH IN USE"
+    re.compile(r'RW?Y\s+(\d+[LCR]?)\s+APCH\s+IN\s+USE'),  # "APCH IN USE" after runway mention
+)
+_DEPARTURE_RUNWAY_RE = re.compile(r'(?:DEPART|DEP)\s+RW?Y\s+(\d+[LCR]?)')  # "DEPART RY XX" or "DEP RWY XX"
+
 def get_current_metar() -> Optional[str]:
     """
     Get current METAR rawOb from Aviation Weather API.
@@ -98,29 +109,10 @@ def _parse_landing_runway(atis_text: str) -> Optional[str]:
     
     text = atis_text.upper()
     
-    # Pattern 1: "LND RY XX" or "LND RWY XX"
-    pattern1 = r'LND\s+RW?Y\s+(\d+[LCR]?)'
-    match = re.search(pattern1, text)
-    if match:
-        return match.group(1)
-    
-    # Pattern 2: "LANDING RUNWAY XX" or "LANDING RY XX"
-    pattern2 = r'LANDING\s+RW?Y\s+(\d+[LCR]?)'
-    match = re.search(pattern2, text)
-    if match:
-        return match.group(1)
-    
-    # Pattern 3: "ILS RY XX APCH IN USE" (implies landing on that runway)
-    pattern3 = r'ILS\s+RW?Y\s+(\d+[LCR]?)\s+APCH\s+IN\s+USE'
-    match = re.search(pattern3, text)
-    if match:
-        return match.group(1)
-    
-    # Pattern 4: Look for "APCH IN USE" after runway mention
-    pattern4 = r'RW?Y\s+(\d+[LCR]?)\s+APCH\s+IN\s+USE'
-    match = re.search(pattern4, text)
-    if match:
-        return match.group(1)
+    for pattern in _LANDING_RUNWAY_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
     
     return None
 
@@ -132,8 +124,7 @@ def _parse_departure_runway(atis_text: str) -> Optional[str]:
     text = atis_text.upper()
     
     # Pattern: "DEPART RY XX" or "DEP RWY XX"
-    pattern = r'(?:DEPART|DEP)\s+RW?Y\s+(\d+[LCR]?)'
-    match = re.search(pattern, text)
+    match = _DEPARTURE_RUNWAY_RE.search(text)
     if match:
         return match.group(1)
     
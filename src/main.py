@@ -32,8 +32,9 @@ class FlightAnnouncer:
     def __init__(self):
         self.running = True
         self.plane_detected = False
-        self.last_weather_update = 0
-        self.last_plane_check = 0
+        # Monotonic timestamps of the last refreshes (-inf so the first loop refreshes both)
+        self.last_weather_update = float('-inf')
+        self.last_plane_check = float('-inf')
         self.current_plane_data = None
         
         # Use the module-level stats tracker instance  
@@ -65,7 +66,8 @@ class FlightAnnouncer:
         try:
             # Simple main loop
             while self.running:
-                current_time = time.time()
+                # One monotonic reading per iteration, immune to wall-clock adjustments (NTP sync)
+                current_time = time.monotonic()
                 
                 # Check for planes every 30 seconds
                 if current_time - self.last_plane_check >= config.FLIGHT_POLL_INTERVAL:
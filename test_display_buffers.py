@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Panel output tests for the display controller's double buffering.
+Runs against a fake rgbmatrix (with and without a fake PIL), so no hardware is needed.
+"""
+
+import hashlib
+import os
+import sys
+import types
+
+import pytest
+
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import config
+
+WIDTH = config.DISPLAY_WIDTH
+HEIGHT = config.DISPLAY_HEIGHT
+
+
+class FakeCanvas:
+    """A frame canvas holding RGB bytes, written the way rgbmatrix writes them."""
+
+    def __init__(self):
+        self.pixels = bytearray(WIDTH * HEIGHT * 3)
+
+    def SetPixel(self, x, y, red, green, blue):
+        if 0 <= x < WIDTH and 0 <= y < HEIGHT:
+            offset = (y * WIDTH + x) * 3
+            self.pixels[offset:offset + 3] = bytes((red, green, blue))
+
+    def SetImage(self, image, offset_x=0, offset_y=0, unsafe=True):
+        assert image.mode == 'RGB'
+        image_width, image_height = image.size
+        for row in range(image_height):
+            for col in range(image_width):
+                source = (row * image_width + col) * 3
+                self.SetPixel(offset_x + col, offset_y + row, *image.data[source:source + 3])
+
+
+class FakeMatrix:
+    """The matrix itself: draws to whichever canvas is on the panel."""
+
+    def __init__(self, options=None):
+        self.active = FakeCanvas()
+
+    def SetPixel(self, *args):
+        self.active.SetPixel(*args)
+
+    def SetImage(self, *args, **kwargs):
+        self.active.SetImage(*args, **kwargs)
+
+    def CreateFrameCanvas(self):
+        return FakeCanvas()
+
+    def SwapOnVSync(self, canvas, framerate_fraction=1):
+        # Like rgbmatrix, hand back the canvas that was on the panel
+        previous, self.active = self.active, canvas
+        return previous
+
+
+class FakeImage:
+    """Just enough of a PIL image: like PIL, it copies the pixel data it is built from."""
+
+    def __init__(self, mode, size, data):
+        self.mode = mode
+        self.size = size
+        self.data = bytes(data)
+
+
+def _fake_modules(with_pil):
+    """Build stand-in rgbmatrix and PIL modules for sys.modules."""
+    rgbmatrix = types.ModuleType('rgbmatrix')
+    rgbmatrix.RGBMatrix = FakeMatrix
+    rgbmatrix.RGBMatrixOptions = types.SimpleNamespace
+    modules = {'rgbmatrix': rgbmatrix}
+
+    if with_pil:
+        image = types.ModuleType('PIL.Image')
+        image.frombuffer = lambda mode, size, data, *args: FakeImage(mode, size, data)
+        image.frombytes = lambda mode, size, data, *args: FakeImage(mode, size, data)
+        pil = types.ModuleType('PIL')
+        pil.Image = image
+        modules.update({'PIL': pil, 'PIL.Image': image})
+    else:
+        # A None entry makes "from PIL import Image" raise ImportError
+        modules.update({'PIL': None, 'PIL.Image': None})
+    return modules
+
+
+@pytest.fixture(params=['pil', 'no_pil'])
+def display(request, monkeypatch):
+    """A DisplayController driving a fake matrix, imported fresh for each PIL mode."""
+    for name, module in _fake_modules(request.param == 'pil').items():
+        monkeypatch.setitem(sys.modules, name, module)
+    monkeypatch.delitem(sys.modules, 'display_controller', raising=False)
+    import display_controller
+    monkeypatch.setattr(display_controller.time, 'sleep', lambda seconds: None)
+
+    controller = display_controller.DisplayController()
+    assert controller.hardware_ready
+    assert (controller.offscreen_canvas is not None) == (request.param == 'pil')
+    return controller
+
+
+def panel(display):
+    """The RGB bytes currently shown on the fake panel."""
+    return bytes(display.matrix.active.pixels)
+
+
+def lit_pixels(display):
+    """Coordinates of every pixel that is not black on the fake panel."""
+    pixels = panel(display)
+    return {(index % WIDTH, index // WIDTH) for index in range(WIDTH * HEIGHT)
+            if pixels[index * 3:index * 3 + 3] != b'\0\0\0'}
+
+
+FLIGHT = {
+    "callsign": "JBU1234",
+    "aircraft_type": "A320",
+    "altitude": 2500,
+    "route": "BOS → LGA"
+}
+
+CANADIAN_FLIGHT = {
+    "callsign": "Endeavor 5361",
+    "aircraft_type": "Airbus A220-300",
+    "origin": "YYZ",
+    "route": "Toronto → LGA"
+}
+
+PRIVATE_JET = {
+    "callsign": "C-GXYZ",
+    "aircraft_type": "Bombardier Global 6000",
+    "origin": "YYZ",
+    "route": "??? → ???",
+    "is_private_jet": True
+}
+
+SUNNY_WEATHER = {
+    "arrivals_runway": "04L",
+    "departures_runway": "04R",
+    "metar": "KLGA 181851Z 25012KT 10SM CLR 29/22 A2995 RMK AO2"
+}
+
+RAINY_WEATHER = {
+    "arrivals_runway": "22",
+    "departures_runway": "04",
+    "metar": "KLGA 181851Z 18006KT 5SM RA BKN015 OVC025 18/16 A2995 RMK AO2"
+}
+
+# Screens shown in turn, so each one is drawn over a different predecessor
+SCREENS = [
+    ("show_weather_info", SUNNY_WEATHER, "SUNNY"),
+    ("show_flight_info", FLIGHT, "FLIGHT"),
+    ("show_weather_info", RAINY_WEATHER, "RAINY"),
+    ("show_flight_info", CANADIAN_FLIGHT, "CANADIAN"),
+    ("show_no_flights_message", {}, "NO_FLIGHTS"),
+    ("show_flight_info", PRIVATE_JET, "PRIVATE_JET"),
+    ("show_no_flights_message", {}, "NO_FLIGHTS"),
+    ("show_flight_info", FLIGHT, "FLIGHT"),
+]
+
+# SHA-256 of the panel after each screen, as drawn by the per-pixel SetPixel
+# implementation these buffers replaced
+EXPECTED_PANELS = {
+    "SUNNY": "bb4a34eddc010f489eab9716487ec93698421e8990bfdd62409dc4d640648dbd",
+    "FLIGHT": "6aa40e58f16c642b215fbf62249959157cc6470a17b7193b718b03cbbd66a419",
+    "RAINY": "2ffa51f001e3e61e693674e3c040a9ce44ef691ab71ef5bdc8dc2ff737eba19c",
+    "CANADIAN": "05f06e1a242f199730ac7d42c4818cdc3ee40b72acc32c820a3c490c829b0ff6",
+    "NO_FLIGHTS": "c846db4ac4272db8b188c90325eb21099e97da6e81f02758833a88b691059a8d",
+    "PRIVATE_JET": "9bfabf5749927687e4873e35ad5d848590788e345f730505103902855d510cd4",
+}
+
+
+def test_screens_match_previous_output(display):
+    """Each show_* screen puts the same pixels on the panel as before, whatever came first."""
+    for method, data, screen in SCREENS:
+        getattr(display, method)(data)
+        assert hashlib.sha256(panel(display)).hexdigest() == EXPECTED_PANELS[screen], screen
+        assert panel(display) == bytes(display.front_buffer)
+
+
+def test_drawing_after_clear_display(display):
+    """Primitives drawn after clear_display() land on a blank panel."""
+    display.show_flight_info(FLIGHT)
+    display.clear_display()
+    assert lit_pixels(display) == set()
+
+    display.set_pixel(10, 10, (255, 0, 0))
+    display._swap_buffers()
+    assert lit_pixels(display) == {(10, 10)}
+
+    display.draw_rectangle(20, 5, 5, 5, (0, 255, 0), filled=True)
+    display._swap_buffers()
+    assert lit_pixels(display) == {(10, 10)} | {(x, y) for x in range(20, 25) for y in range(5, 10)}
+    assert panel(display) == bytes(display.front_buffer)
+
+
+def test_swap_after_force_full_update(display):
+    """A swap after _force_full_update() builds on what the forced update showed."""
+    display.set_pixel(3, 3, (9, 9, 9))
+    display._swap_buffers()
+
+    display._clear_buffer()
+    display._force_full_update()
+    assert lit_pixels(display) == set()
+
+    display.set_pixel(3, 3, (9, 9, 9))
+    display.set_pixel(4, 4, (9, 9, 9))
+    display._swap_buffers()
+    assert lit_pixels(display) == {(3, 3), (4, 4)}
+    assert panel(display) == bytes(display.front_buffer)
+
+
+def test_show_redraws_after_force_full_update(display):
+    """A repeated show_* call redraws its screen once _force_full_update() replaced it."""
+    display.show_no_flights_message({})
+    expected = panel(display)
+
+    display._clear_buffer()
+    display._force_full_update()
+    assert lit_pixels(display) == set()
+
+    display.show_no_flights_message({})
+    assert panel(display) == expected
+
+
+def test_update_region_resends_unchanged_pixels(display):
+    """update_region() restores a region on the panel even when the frame did not change it."""
+    display.show_no_flights_message({})
+    expected = panel(display)
+
+    # Something outside the controller draws on the panel
+    display.matrix.active.SetPixel(5, 5, 255, 255, 255)
+    display.matrix.active.SetPixel(100, 20, 255, 255, 255)
+    assert panel(display) != expected
+
+    display.update_region(0, 0, 10, 10)
+    display.update_region(96, 16, 8, 8)
+    display._swap_buffers()
+    assert panel(display) == expected
+    assert display.get_dirty_pixel_count() == 0
@@ -156,8 +156,7 @@ def print_summary():
     print("  - Atomic swaps prevent flickering")
     
     print("\n✓ Selective Pixel Updating:")
-    print("  - Dirty pixel tracking with set() for O(1) operations")
-    print("  - Dirty region tracking for bulk updates")
+    print("  - Dirty bounding box tracking since the last swap")
     print("  - Only changed pixels are updated on hardware")
     
     print("\n✓ Performance Optimizations:")